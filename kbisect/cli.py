@@ -152,22 +152,21 @@ def cmd_init(args: argparse.Namespace) -> int:
     deploy_path = config_dict["slave"].get("bisect_path", "/root/kernel-bisect/lib")
     auto_deploy = config_dict.get("deployment", {}).get("auto_deploy", True)
 
-    deployer = SlaveDeployer(slave_host, slave_user, deploy_path)
-
-    # Check if slave is deployed
-    print("Checking slave setup...")
-    if not deployer.is_deployed():
-        if auto_deploy or args.force_deploy:
-            print("Slave not configured. Deploying automatically...\n")
-            if not deployer.deploy_full():
-                print("\n✗ Deployment failed!")
+    with SlaveDeployer(slave_host, slave_user, deploy_path) as deployer:
+        # Check if slave is deployed
+        print("Checking slave setup...")
+        if not deployer.is_deployed():
+            if auto_deploy or args.force_deploy:
+                print("Slave not configured. Deploying automatically...\n")
+                if not deployer.deploy_full():
+                    print("\n✗ Deployment failed!")
+                    return 1
+            else:
+                print("\n✗ Slave is not deployed and auto_deploy is disabled")
+                print("Run: kbisect deploy to deploy manually")
                 return 1
         else:
-            print("\n✗ Slave is not deployed and auto_deploy is disabled")
-            print("Run: kbisect deploy to deploy manually")
-            return 1
-    else:
-        print("✓ Slave is already deployed\n")
+            print("✓ Slave is already deployed\n")
 
     # Create bisect config
     config = create_bisect_config(config_dict, args)
@@ -819,39 +818,38 @@ def cmd_deploy(args: argparse.Namespace) -> int:
     slave_user = config_dict["slave"].get("ssh_user", "root")
     deploy_path = config_dict["slave"].get("bisect_path", "/root/kernel-bisect/lib")
 
-    deployer = SlaveDeployer(slave_host, slave_user, deploy_path)
+    with SlaveDeployer(slave_host, slave_user, deploy_path) as deployer:
+        if args.verify_only:
+            # Just verify deployment
+            print(f"Verifying deployment on {slave_host}...")
+            if deployer.is_deployed():
+                print("\n✓ Slave is deployed")
+                success, _checks = deployer.verify_deployment()
+                return 0 if success else 1
 
-    if args.verify_only:
-        # Just verify deployment
-        print(f"Verifying deployment on {slave_host}...")
-        if deployer.is_deployed():
-            print("\n✓ Slave is deployed")
-            success, _checks = deployer.verify_deployment()
-            return 0 if success else 1
+            print("\n✗ Slave is NOT deployed")
+            return 1
 
-        print("\n✗ Slave is NOT deployed")
-        return 1
+        if args.update_only:
+            # Update library only
+            print(f"Updating library on {slave_host}...")
+            if deployer.update_library():
+                print("\n✓ Library updated successfully")
+                return 0
 
-    if args.update_only:
-        # Update library only
-        print(f"Updating library on {slave_host}...")
-        if deployer.update_library():
-            print("\n✓ Library updated successfully")
+            print("\n✗ Library update failed")
+            return 1
+
+        # Full deployment
+        print(f"Deploying to {slave_host}...")
+        if deployer.deploy_full():
+            print("\n✓ Deployment successful!")
+            print(f"\nSlave {slave_host} is now ready for bisection")
             return 0
 
-        print("\n✗ Library update failed")
+        print("\n✗ Deployment failed!")
         return 1
 
-    # Full deployment
-    print(f"Deploying to {slave_host}...")
-    if deployer.deploy_full():
-        print("\n✓ Deployment successful!")
-        print(f"\nSlave {slave_host} is now ready for bisection")
-        return 0
-
-    print("\n✗ Deployment failed!")
-    return 1
-
 
 def cmd_init_config(args: argparse.Namespace) -> int:
     """Generate example configuration file.
@@ -1,7 +1,9 @@
 """Deployment implementations for setting up slave machines."""
 
-from kbisect.deployment.deployer import SlaveDeployer
+from kbisect.deployment.deployer import MultiSlaveDeployer, SlaveDeployer
+
 
 __all__ = [
+    "MultiSlaveDeployer",
     "SlaveDeployer",
 ]
@@ -4,14 +4,21 @@
 Handles copying scripts, installing services, and initializing the slave machine.
 """
 
+import hashlib
 import logging
-import os
 import shlex
 import subprocess
-from pathlib import Path
-from typing import List, Optional, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, BinaryIO, Callable, Dict, List, Optional, Tuple, Type
 
-from kbisect.remote import SSHClient
+from kbisect.remote import SSHClient, default_control_path
+
+
+if TYPE_CHECKING:
+    from types import TracebackType
 
 
 logger = logging.getLogger(__name__)
@@ -20,6 +27,11 @@ logger = logging.getLogger(__name__)
 DEFAULT_DEPLOY_PATH = "/root/kernel-bisect/lib"
 DEFAULT_STATE_DIR = "/var/lib/kernel-bisect"
 DEFAULT_SSH_TIMEOUT = 30
+DEFAULT_MAX_WORKERS = 32
+DEFAULT_DEPLOYED_CACHE_TTL = 30.0
+RSYNC_ERROR_LOG_LIMIT = 4096
+# Verification probes that must pass for the slave to count as deployed
+DEPLOYED_PROBE_TAGS = ("D", "L", "P")
 
 
 class DeploymentError(Exception):
@@ -45,7 +57,9 @@ class SlaveDeployer:
         slave_user: SSH username for slave access
         deploy_path: Target path on slave for library deployment
         local_lib_path: Path to local library files
+        compress: Whether the SSH connection is compressed
         ssh_client: SSH client for remote operations
+        last_checks: Check results from the most recent verification
     """
 
     def __init__(
@@ -54,6 +68,8 @@ class SlaveDeployer:
         slave_user: str = "root",
         deploy_path: str = DEFAULT_DEPLOY_PATH,
         local_lib_path: Optional[str] = None,
+        compress: bool = False,
+        ssh_cipher: Optional[str] = None,
     ) -> None:
         """Initialize slave deployer.
 
@@ -62,11 +78,32 @@ class SlaveDeployer:
             slave_user: SSH username (defaults to root)
             deploy_path: Deployment path on slave
             local_lib_path: Local library path (auto-detected if None)
+            compress: Compress the SSH connection, including file transfers
+                (useful on slow links only)
+            ssh_cipher: SSH cipher for the slave connection, e.g.
+                "aes128-gcm@openssh.com" on fast links (None for ssh defaults)
         """
         self.slave_host = slave_host
         self.slave_user = slave_user
         self.deploy_path = deploy_path
-        self.ssh_client = SSHClient(slave_host, slave_user)
+        self.compress = compress
+
+        # Shell-quoted remote paths, computed once for all remote commands
+        self._q_deploy = shlex.quote(deploy_path)
+        self._q_lib = shlex.quote(f"{deploy_path}/bisect-functions.sh")
+        self._q_state = shlex.quote(DEFAULT_STATE_DIR)
+        self._q_protlist = shlex.quote(f"{DEFAULT_STATE_DIR}/protected-kernels.list")
+
+        # Multiplex all SSH commands and rsync transfers over one connection.
+        # Compression is applied at the SSH level so streamed files and rsync
+        # transfers both honour it.
+        self.ssh_client = SSHClient(
+            slave_host,
+            slave_user,
+            control_path=default_control_path(slave_host, slave_user),
+            cipher=ssh_cipher,
+            compression=compress,
+        )
 
         # Determine local library path
         if local_lib_path:
@@ -76,14 +113,41 @@ class SlaveDeployer:
             script_dir = Path(__file__).parent.parent
             self.local_lib_path = script_dir / "lib"
 
+        self.last_checks: List[str] = []
+
+        # Cached is_deployed() result as (monotonic timestamp, result)
+        self._deployed_cache: Optional[Tuple[float, bool]] = None
+        self._cache_ttl = DEFAULT_DEPLOYED_CACHE_TTL
+
+    def __enter__(self) -> "SlaveDeployer":
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional["TracebackType"],
+    ) -> None:
+        """Exit context manager and close the SSH connection."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the persistent SSH connection to the slave."""
+        self.ssh_client.close()
+
     def _ssh_command(
-        self, command: str, timeout: int = DEFAULT_SSH_TIMEOUT
+        self,
+        command: str,
+        timeout: int = DEFAULT_SSH_TIMEOUT,
+        input_file: Optional[BinaryIO] = None,
     ) -> Tuple[int, str, str]:
         """Execute SSH command on slave.
 
         Args:
             command: Command to execute
             timeout: Command timeout in seconds
+            input_file: Optional open file fed to the command's stdin
 
         Returns:
             Tuple of (return_code, stdout, stderr)
@@ -92,18 +156,23 @@ class SlaveDeployer:
             SSHError: If SSH command fails to execute
         """
         try:
-            return self.ssh_client.run_command(command, timeout=timeout)
+            return self.ssh_client.run_command(command, timeout=timeout, input_file=input_file)
         except Exception as exc:
             msg = f"SSH command failed: {exc}"
             logger.error(msg)
             raise SSHError(msg) from exc
 
-    def _copy_to_slave(self, local_path: str, remote_path: str) -> bool:
-        """Copy files to slave using rsync.
+    def _copy_to_slave(self, local_path: str, remote_path: str, executable: bool = False) -> bool:
+        """Copy files to slave.
+
+        Single files are streamed over the already open (multiplexed) SSH
+        connection, avoiding an rsync process and its protocol negotiation.
+        Directory trees are copied with rsync.
 
         Args:
             local_path: Local file or directory path
             remote_path: Remote destination path
+            executable: Set executable bit on copied files as part of the transfer
 
         Returns:
             True if copy succeeded, False otherwise
@@ -112,28 +181,43 @@ class SlaveDeployer:
             TransferError: If file transfer fails to execute
         """
         try:
-            # Step 1: Create remote directory structure
-            remote_dir = os.path.dirname(remote_path)
-            ret, _, stderr = self._ssh_command(f"mkdir -p {shlex.quote(remote_dir)}")
-            if ret != 0:
-                logger.error(f"Failed to create remote directory: {stderr}")
-                return False
+            if Path(local_path).is_file():
+                return self._stream_file_to_slave(local_path, remote_path, executable)
 
-            # Step 2: Copy file with rsync
+            # Remote directory is created by rsync itself within the same SSH session
+            remote_dir = str(PurePosixPath(remote_path).parent)
             rsync_cmd = [
                 "rsync",
-                "-az",  # Archive mode (preserves permissions, times, etc.) + compression
+                "-a",  # Archive mode (preserves permissions, times, etc.)
+                "-W",  # Whole files: delta algorithm is pure overhead for fresh deploys
                 "-e",
-                "ssh -o StrictHostKeyChecking=no -o ConnectTimeout=10",
-                local_path,
-                f"{self.slave_user}@{self.slave_host}:{remote_path}",
+                shlex.join(["ssh", *self.ssh_client.ssh_options()]),
+                f"--rsync-path=mkdir -p {shlex.quote(remote_dir)} && rsync",
             ]
-
-            result = subprocess.run(rsync_cmd, capture_output=True, text=True, timeout=60, check=False)
+            if executable:
+                rsync_cmd.append("--chmod=F+x")
+            log_stats = logger.isEnabledFor(logging.DEBUG)
+            if log_stats:
+                rsync_cmd.append("--stats")
+            rsync_cmd.extend([local_path, f"{self.slave_user}@{self.slave_host}:{remote_path}"])
+
+            # Output is only needed for stats or on failure, so keep it as raw
+            # bytes and discard stdout unless stats were requested. stderr is
+            # buffered in full; only the tail logged on failure is capped.
+            result = subprocess.run(
+                rsync_cmd,
+                stdout=subprocess.PIPE if log_stats else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=60,
+                check=False,
+            )
             if result.returncode == 0:
+                if log_stats:
+                    logger.debug(f"rsync stats: {result.stdout.decode(errors='replace')}")
                 return True
 
-            logger.error(f"rsync failed: {result.stderr}")
+            stderr = result.stderr[-RSYNC_ERROR_LOG_LIMIT:].decode(errors="replace")
+            logger.error(f"rsync failed: {stderr}")
             return False
 
         except subprocess.TimeoutExpired:
@@ -145,9 +229,101 @@ class SlaveDeployer:
             logger.error(msg)
             raise TransferError(msg) from exc
 
+    def _stream_file_to_slave(self, local_path: str, remote_path: str, executable: bool) -> bool:
+        """Copy a single file to slave through the stdin of an SSH command.
+
+        Args:
+            local_path: Local file path
+            remote_path: Remote destination path
+            executable: Set executable bit on the copied file
+
+        Returns:
+            True if copy succeeded, False otherwise
+        """
+        # Write to a temporary file and rename it into place, so an interrupted
+        # transfer never leaves a truncated file at the destination
+        remote_dir = shlex.quote(str(PurePosixPath(remote_path).parent))
+        remote_file = shlex.quote(remote_path)
+        remote_tmp = shlex.quote(f"{remote_path}.tmp")
+        command = f"mkdir -p {remote_dir} && cat > {remote_tmp}"
+        if executable:
+            command += f" && chmod +x {remote_tmp}"
+        command += f" && mv -f {remote_tmp} {remote_file} || {{ rm -f {remote_tmp}; false; }}"
+
+        with Path(local_path).open("rb") as input_file:
+            ret, _, stderr = self._ssh_command(command, timeout=60, input_file=input_file)
+
+        if ret != 0:
+            logger.error(f"File transfer failed: {stderr}")
+            return False
+
+        return True
+
+    def _run_probes(self, probes: List[Tuple[str, str]]) -> Dict[str, int]:
+        """Run several check commands on slave in a single SSH session.
+
+        Each probe is executed in turn and reports its exit code on a
+        separate "<tag>:<exit code>" line, which is parsed locally.
+
+        Args:
+            probes: List of (tag, command) pairs
+
+        Returns:
+            Dictionary mapping tag to exit code. Tags whose status could not
+            be determined (e.g. SSH failure) are missing from the result.
+        """
+        try:
+            _, stdout, _ = self._ssh_command(self._probe_script(probes))
+        except SSHError:
+            return {}
+
+        return self._parse_probe_output(stdout)
+
+    @staticmethod
+    def _probe_script(probes: List[Tuple[str, str]]) -> str:
+        """Build a shell script running probes and reporting "<tag>:<exit code>".
+
+        Args:
+            probes: List of (tag, command) pairs
+
+        Returns:
+            Shell script to run on slave
+        """
+        return "; ".join(f"{command}; echo {tag}:$?" for tag, command in probes)
+
+    @staticmethod
+    def _parse_probe_output(output: str) -> Dict[str, int]:
+        """Parse "<tag>:<exit code>" lines emitted by batched probes.
+
+        Args:
+            output: Standard output of the batched command
+
+        Returns:
+            Dictionary mapping tag to exit code
+        """
+        results: Dict[str, int] = {}
+
+        for line in output.splitlines():
+            tag, sep, code = line.strip().partition(":")
+            if sep and code.isdigit():
+                results[tag] = int(code)
+
+        return results
+
+    def _required_directories(self) -> List[str]:
+        """Get shell-quoted directories that must exist on slave.
+
+        Returns:
+            List of quoted directory paths
+        """
+        return [self._q_deploy, self._q_state, "/var/log"]
+
     def check_connectivity(self) -> bool:
         """Check if slave is reachable via SSH.
 
+        This also opens the multiplexed master connection reused by later
+        commands and transfers.
+
         Returns:
             True if SSH connection works, False otherwise
         """
@@ -174,34 +350,39 @@ class SlaveDeployer:
         """
         logger.info("Creating directories on slave...")
 
-        directories = [
-            self.deploy_path,
-            DEFAULT_STATE_DIR,
-            "/var/log",
-        ]
+        # Remote state is about to change
+        self._deployed_cache = None
 
-        for directory in directories:
-            try:
-                ret, _, stderr = self._ssh_command(f"mkdir -p {directory}")
-            except SSHError:
-                logger.error(f"Failed to create {directory}")
-                return False
+        directories = self._required_directories()
+        command = "mkdir -p " + " ".join(directories)
 
-            if ret != 0:
-                logger.error(f"Failed to create {directory}: {stderr}")
-                return False
+        try:
+            ret, _, stderr = self._ssh_command(command)
+        except SSHError:
+            logger.error(f"Failed to create directories: {', '.join(directories)}")
+            return False
+
+        if ret != 0:
+            logger.error(f"Failed to create directories: {stderr}")
+            return False
 
         logger.info("✓ Directories created")
         return True
 
     def deploy_library(self) -> bool:
-        """Deploy bisect library file via rsync.
+        """Deploy bisect library file to slave.
+
+        The transfer is skipped when the remote library already has the same
+        content as the local one.
 
         Returns:
             True if library deployed successfully, False otherwise
         """
         logger.info(f"Deploying library from {self.local_lib_path} to slave...")
 
+        # Remote state is about to change
+        self._deployed_cache = None
+
         if not self.local_lib_path.exists():
             logger.error(f"Local library path not found: {self.local_lib_path}")
             return False
@@ -211,39 +392,58 @@ class SlaveDeployer:
             logger.error(f"Library file not found: {library_file}")
             return False
 
-        # Ensure remote directory exists
         try:
-            ret, _, _ = self._ssh_command(f"mkdir -p {self.deploy_path}")
-        except SSHError:
-            logger.error("Failed to create deploy directory on slave")
+            local_hash = hashlib.sha256(library_file.read_bytes()).hexdigest()
+        except OSError as exc:
+            logger.error(f"Failed to read library file {library_file}: {exc}")
             return False
 
-        if ret != 0:
-            logger.error("Failed to create deploy directory on slave")
-            return False
+        if self._remote_library_matches(local_hash):
+            logger.info("✓ Library up-to-date; skipping transfer")
+            return True
 
-        # Copy library file
+        # Copy library file (remote directory and executable bit are handled during transfer)
         try:
             if not self._copy_to_slave(
-                str(library_file), f"{self.deploy_path}/bisect-functions.sh"
+                str(library_file), f"{self.deploy_path}/bisect-functions.sh", executable=True
             ):
                 logger.error("Failed to copy library file")
                 return False
         except TransferError:
             return False
 
-        # Make library executable
+        logger.info("✓ Library deployed")
+        return True
+
+    def _remote_library_matches(self, local_hash: str) -> bool:
+        """Check whether the remote library has the same content as the local one.
+
+        In the same SSH call, the deploy directory is created and the
+        executable bit is set on an existing remote library, so a matching
+        library needs no further remote operations.
+
+        Args:
+            local_hash: SHA256 hex digest of the local library file
+
+        Returns:
+            True if the remote library SHA256 matches the local file, False otherwise
+        """
+        command = (
+            f"mkdir -p {self._q_deploy} && "
+            f"{{ chmod +x {self._q_lib} 2>/dev/null; sha256sum {self._q_lib} 2>/dev/null; true; }}"
+        )
+
         try:
-            ret, _, stderr = self._ssh_command(f"chmod +x {self.deploy_path}/bisect-functions.sh")
+            ret, stdout, _ = self._ssh_command(command)
         except SSHError:
-            logger.warning("Failed to chmod library")
-            return True  # Not fatal
+            return False
 
         if ret != 0:
-            logger.warning(f"Failed to chmod library: {stderr}")
+            return False
 
-        logger.info("✓ Library deployed")
-        return True
+        # sha256sum prints "<hash>  <path>"; anything else means no usable hash
+        fields = stdout.split()
+        return bool(fields) and fields[0] == local_hash
 
     def initialize_protection(self) -> bool:
         """Initialize kernel protection on slave.
@@ -253,10 +453,11 @@ class SlaveDeployer:
         """
         logger.info("Initializing kernel protection...")
 
+        # Remote state is about to change
+        self._deployed_cache = None
+
         # Call init_protection function from library
-        init_command = (
-            f"source {self.deploy_path}/bisect-functions.sh && init_protection"
-        )
+        init_command = f"source {self._q_lib} && init_protection"
 
         try:
             ret, stdout, stderr = self._ssh_command(init_command, timeout=60)
@@ -280,68 +481,167 @@ class SlaveDeployer:
         """
         logger.info("Verifying deployment...")
 
+        # All probes run in a single SSH session
+        results = self._run_probes(self._verify_probes())
+
+        return self._evaluate_checks(results)
+
+    def _verify_probes(self) -> List[Tuple[str, str]]:
+        """Get probes checking deployment state on slave.
+
+        Returns:
+            List of (tag, command) pairs
+        """
+        return [
+            ("D", f"test -d {self._q_deploy}"),
+            ("L", f"test -x {self._q_lib}"),
+            ("P", f"test -f {self._q_protlist}"),
+            ("S", f"test -d {self._q_state}"),
+        ]
+
+    def _evaluate_checks(self, results: Dict[str, int]) -> Tuple[bool, List[str]]:
+        """Turn verification probe results into check messages.
+
+        Args:
+            results: Dictionary mapping probe tag to exit code
+
+        Returns:
+            Tuple of (all_checks_passed, list_of_check_results)
+        """
+        # (tag, passed message, failed message, error message)
+        check_messages = [
+            (
+                "D",
+                "✓ Library directory exists",
+                "✗ Library directory missing",
+                "✗ Library directory check failed",
+            ),
+            (
+                "L",
+                "✓ bisect-functions.sh executable",
+                "✗ bisect-functions.sh not found",
+                "✗ bisect-functions.sh check failed",
+            ),
+            (
+                "P",
+                "✓ Kernel protection initialized",
+                "✗ Kernel protection not initialized",
+                "✗ Kernel protection check failed",
+            ),
+            (
+                "S",
+                "✓ State directory exists",
+                "✗ State directory missing",
+                "✗ State directory check failed",
+            ),
+        ]
+
         checks = []
         all_passed = True
 
-        # Check 1: Library directory exists
-        try:
-            ret, _, _ = self._ssh_command(f"test -d {self.deploy_path}")
+        for tag, passed_msg, failed_msg, error_msg in check_messages:
+            ret = results.get(tag)
             if ret == 0:
-                checks.append("✓ Library directory exists")
-            else:
-                checks.append("✗ Library directory missing")
+                checks.append(passed_msg)
+            elif ret is None:
+                checks.append(error_msg)
                 all_passed = False
-        except SSHError:
-            checks.append("✗ Library directory check failed")
-            all_passed = False
-
-        # Check 2: bisect-functions.sh exists and is executable
-        try:
-            ret, _, _ = self._ssh_command(f"test -x {self.deploy_path}/bisect-functions.sh")
-            if ret == 0:
-                checks.append("✓ bisect-functions.sh executable")
             else:
-                checks.append("✗ bisect-functions.sh not found")
+                checks.append(failed_msg)
                 all_passed = False
-        except SSHError:
-            checks.append("✗ bisect-functions.sh check failed")
-            all_passed = False
 
-        # Check 3: Protection initialized
+        for check in checks:
+            logger.info(f"  {check}")
+
+        self.last_checks = checks
+        self._deployed_cache = (time.monotonic(), self._deployed_from_results(results))
+        return all_passed, checks
+
+    @staticmethod
+    def _deployed_from_results(results: Dict[str, int]) -> bool:
+        """Decide whether slave is deployed from verification probe results.
+
+        Args:
+            results: Dictionary mapping probe tag to exit code
+
+        Returns:
+            True if all critical components exist, False otherwise
+        """
+        return all(results.get(tag) == 0 for tag in DEPLOYED_PROBE_TAGS)
+
+    def _bootstrap(self) -> Tuple[bool, bool]:
+        """Check connectivity and create directories in a single SSH call.
+
+        This also opens the multiplexed master connection reused by the
+        remaining deployment steps.
+
+        Returns:
+            Tuple of (connected, directories_created)
+        """
+        logger.info(f"Checking SSH connectivity to {self.slave_host} and creating directories...")
+
+        # Remote state is about to change
+        self._deployed_cache = None
+
+        command = f"echo C:0; mkdir -p {' '.join(self._required_directories())}; echo M:$?"
+
         try:
-            ret, _, _ = self._ssh_command(
-                f"test -f {DEFAULT_STATE_DIR}/protected-kernels.list"
-            )
-            if ret == 0:
-                checks.append("✓ Kernel protection initialized")
-            else:
-                checks.append("✗ Kernel protection not initialized")
-                all_passed = False
+            _, stdout, stderr = self._ssh_command(command, timeout=300)
         except SSHError:
-            checks.append("✗ Kernel protection check failed")
-            all_passed = False
+            return False, False
+
+        results = self._parse_probe_output(stdout)
+        if "C" not in results:
+            logger.error(f"✗ SSH connectivity failed: {stderr}")
+            return False, False
+
+        logger.info("✓ SSH connectivity OK")
+
+        if results.get("M") != 0:
+            logger.error(f"Failed to create directories: {stderr}")
+            return True, False
+
+        logger.info("✓ Directories created")
+        return True, True
+
+    def _initialize_and_verify(self) -> Optional[Dict[str, int]]:
+        """Initialize protection and run verification probes in a single SSH call.
+
+        Returns:
+            Dictionary mapping verification probe tag to exit code, or None
+            if protection initialization failed
+        """
+        logger.info("Initializing kernel protection...")
+
+        # Remote state is about to change
+        self._deployed_cache = None
+
+        command = (
+            f"source {self._q_lib} && init_protection; echo I:$?; "
+            + self._probe_script(self._verify_probes())
+        )
 
-        # Check 4: State directory exists
         try:
-            ret, _, _ = self._ssh_command(f"test -d {DEFAULT_STATE_DIR}")
-            if ret == 0:
-                checks.append("✓ State directory exists")
-            else:
-                checks.append("✗ State directory missing")
-                all_passed = False
+            _, stdout, stderr = self._ssh_command(command, timeout=60)
         except SSHError:
-            checks.append("✗ State directory check failed")
-            all_passed = False
+            logger.error("Failed to initialize protection")
+            return None
 
-        for check in checks:
-            logger.info(f"  {check}")
+        results = self._parse_probe_output(stdout)
+        if results.pop("I", None) != 0:
+            logger.error(f"Failed to initialize protection: {stderr}")
+            return None
 
-        return all_passed, checks
+        logger.info("✓ Kernel protection initialized")
+        logger.debug(f"Protection output: {stdout}")
+        return results
 
     def deploy_full(self) -> bool:
         """Full deployment workflow.
 
-        Executes all deployment steps in sequence.
+        Executes all deployment steps in sequence. Connectivity check and
+        directory creation share one SSH call, as do protection
+        initialization and verification.
 
         Returns:
             True if deployment successful, False otherwise
@@ -350,28 +650,29 @@ class SlaveDeployer:
         logger.info("Starting slave deployment")
         logger.info("=" * 60)
 
-        # Step 1: Check connectivity
-        if not self.check_connectivity():
+        # Step 1: Check connectivity and create directories
+        connected, directories_created = self._bootstrap()
+        if not connected:
             logger.error("Deployment failed: No SSH connectivity")
             return False
 
-        # Step 2: Create directories
-        if not self.create_directories():
+        if not directories_created:
             logger.error("Deployment failed: Could not create directories")
             return False
 
-        # Step 3: Deploy library
+        # Step 2: Deploy library
         if not self.deploy_library():
             logger.error("Deployment failed: Could not deploy library")
             return False
 
-        # Step 4: Initialize protection
-        if not self.initialize_protection():
+        # Step 3: Initialize protection and verify deployment
+        results = self._initialize_and_verify()
+        if results is None:
             logger.error("Deployment failed: Could not initialize protection")
             return False
 
-        # Step 5: Verify deployment
-        success, checks = self.verify_deployment()
+        logger.info("Verifying deployment...")
+        success, _checks = self._evaluate_checks(results)
 
         if success:
             logger.info("=" * 60)
@@ -387,26 +688,29 @@ class SlaveDeployer:
     def is_deployed(self) -> bool:
         """Check if slave is already deployed.
 
+        The result is cached for a short time, since deployment state only
+        changes through this deployer. Methods changing remote state
+        invalidate the cache, and verification refreshes it.
+
         Returns:
             True if slave appears to be deployed, False otherwise
         """
-        # Quick check: do critical components exist?
-        critical_checks = [
-            f"test -d {self.deploy_path}",
-            f"test -x {self.deploy_path}/bisect-functions.sh",
-            f"test -f {DEFAULT_STATE_DIR}/protected-kernels.list",
+        if self._deployed_cache is not None:
+            checked_at, cached = self._deployed_cache
+            if time.monotonic() - checked_at < self._cache_ttl:
+                return cached
+
+        # Quick check: do critical components exist? (single SSH round-trip)
+        probes = [
+            (tag, command)
+            for tag, command in self._verify_probes()
+            if tag in DEPLOYED_PROBE_TAGS
         ]
+        results = self._run_probes(probes)
+        deployed = self._deployed_from_results(results)
 
-        for check in critical_checks:
-            try:
-                ret, _, _ = self._ssh_command(check)
-            except SSHError:
-                return False
-
-            if ret != 0:
-                return False
-
-        return True
+        self._deployed_cache = (time.monotonic(), deployed)
+        return deployed
 
     def update_library(self) -> bool:
         """Update only the library file (for updates after initial deployment).
@@ -424,39 +728,240 @@ class SlaveDeployer:
         return True
 
 
+class MultiSlaveDeployer:
+    """Deploy to multiple slave machines concurrently.
+
+    Each host gets its own SlaveDeployer; deployments are IO-bound (SSH and
+    rsync subprocesses), so they are fanned out over a thread pool. Worker
+    threads are named after the host they serve, so log records can be
+    attributed via %(threadName)s.
+
+    Attributes:
+        deployers: Per-host slave deployers
+        max_workers: Maximum number of concurrent deployments
+    """
+
+    def __init__(
+        self,
+        slave_hosts: List[str],
+        slave_user: str = "root",
+        deploy_path: str = DEFAULT_DEPLOY_PATH,
+        local_lib_path: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        compress: bool = False,
+        ssh_cipher: Optional[str] = None,
+    ) -> None:
+        """Initialize multi-slave deployer.
+
+        Args:
+            slave_hosts: Slave hostnames or IP addresses (duplicates are ignored,
+                as they would share one SSH master connection)
+            slave_user: SSH username (defaults to root)
+            deploy_path: Deployment path on slaves
+            local_lib_path: Local library path (auto-detected if None)
+            max_workers: Maximum number of concurrent deployments
+            compress: Compress the SSH connections, including file transfers
+            ssh_cipher: SSH cipher for the slave connections (None for ssh defaults)
+        """
+        self.deployers = [
+            SlaveDeployer(
+                host,
+                slave_user,
+                deploy_path,
+                local_lib_path,
+                compress=compress,
+                ssh_cipher=ssh_cipher,
+            )
+            for host in dict.fromkeys(slave_hosts)
+        ]
+        self.max_workers = max_workers
+
+    @staticmethod
+    def _run_host(
+        deployer: SlaveDeployer, action: Callable[[SlaveDeployer], bool]
+    ) -> Tuple[str, bool, List[str]]:
+        """Run action for a single host and close its connection.
+
+        Args:
+            deployer: Deployer for the host
+            action: Callable performing the work, returning success
+
+        Returns:
+            Tuple of (host, success, list_of_check_results)
+        """
+        threading.current_thread().name = deployer.slave_host
+
+        try:
+            success = action(deployer)
+        except Exception:
+            # Report the host as failed without losing other hosts' results
+            logger.exception(f"Deployment to {deployer.slave_host} failed")
+            success = False
+        finally:
+            deployer.close()
+
+        return deployer.slave_host, success, deployer.last_checks
+
+    def run(self, action: Callable[[SlaveDeployer], bool]) -> List[Tuple[str, bool, List[str]]]:
+        """Run action on all slaves concurrently.
+
+        Args:
+            action: Callable taking a SlaveDeployer and returning success
+
+        Returns:
+            List of (host, success, list_of_check_results) in host order
+        """
+        if not self.deployers:
+            return []
+
+        workers = min(self.max_workers, len(self.deployers))
+        logger.info(f"Running on {len(self.deployers)} slaves ({workers} in parallel)...")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda d: self._run_host(d, action), self.deployers))
+
+    def deploy_full(self) -> List[Tuple[str, bool, List[str]]]:
+        """Run full deployment on all slaves concurrently.
+
+        Returns:
+            List of (host, success, list_of_check_results) in host order
+        """
+        return self.run(SlaveDeployer.deploy_full)
+
+
+def _read_hosts_file(path: str) -> List[str]:
+    """Read slave hosts from file, one per line.
+
+    Blank lines and lines starting with '#' are ignored, as are duplicate
+    hosts. The SSH user is given separately, so "user@host" entries are
+    rejected.
+
+    Args:
+        path: Path to hosts file
+
+    Returns:
+        List of unique hostnames in file order
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If an entry contains a user name
+    """
+    hosts: Dict[str, None] = {}
+    with Path(path).open(encoding="utf-8") as hosts_file:
+        for line_num, line in enumerate(hosts_file, start=1):
+            host = line.strip()
+            if not host or host.startswith("#"):
+                continue
+            if "@" in host:
+                msg = f"{path}:{line_num}: 'user@host' entries are not supported, use --user"
+                raise ValueError(msg)
+            hosts[host] = None
+    return list(hosts)
+
+
+def _run_action(deployer: SlaveDeployer, check_only: bool, update_only: bool) -> bool:
+    """Run requested deployer action for a single slave.
+
+    Args:
+        deployer: Deployer for the slave
+        check_only: Only check if deployed
+        update_only: Only update library
+
+    Returns:
+        True if action succeeded, False otherwise
+    """
+    if check_only:
+        if deployer.is_deployed():
+            print(f"Slave {deployer.slave_host} is deployed")
+            success, _checks = deployer.verify_deployment()
+            return success
+
+        print(f"Slave {deployer.slave_host} is NOT deployed")
+        return False
+
+    if update_only:
+        return deployer.update_library()
+
+    # Full deployment
+    return deployer.deploy_full()
+
+
 def main() -> int:
     """Test deployer."""
     import argparse
 
     parser = argparse.ArgumentParser(description="Slave Deployer")
-    parser.add_argument("slave_host", help="Slave hostname or IP")
+    parser.add_argument("slave_host", nargs="?", help="Slave hostname or IP")
+    parser.add_argument(
+        "--hosts-file", help="File with slave hosts (one per line) to deploy in parallel"
+    )
+    parser.add_argument(
+        "--parallelism",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Maximum number of hosts handled concurrently (default: {DEFAULT_MAX_WORKERS})",
+    )
     parser.add_argument("--user", default="root", help="SSH user")
     parser.add_argument(
         "--deploy-path", default=DEFAULT_DEPLOY_PATH, help="Deployment path on slave"
     )
     parser.add_argument("--check-only", action="store_true", help="Only check if deployed")
     parser.add_argument("--update-only", action="store_true", help="Only update library")
+    parser.add_argument(
+        "--compress", action="store_true", help="Compress SSH traffic (for slow links)"
+    )
+    parser.add_argument("--ssh-cipher", help="SSH cipher to use (default: ssh defaults)")
 
     args = parser.parse_args()
 
-    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    if bool(args.slave_host) == bool(args.hosts_file):
+        parser.error("specify exactly one of slave_host or --hosts-file")
 
-    deployer = SlaveDeployer(args.slave_host, args.user, args.deploy_path)
+    if args.parallelism < 1:
+        parser.error("--parallelism must be at least 1")
 
-    if args.check_only:
-        if deployer.is_deployed():
-            print("Slave is deployed")
-            success, checks = deployer.verify_deployment()
-            return 0 if success else 1
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] [%(threadName)s] %(message)s"
+    )
 
-        print("Slave is NOT deployed")
-        return 1
+    if args.slave_host:
+        with SlaveDeployer(
+            args.slave_host,
+            args.user,
+            args.deploy_path,
+            compress=args.compress,
+            ssh_cipher=args.ssh_cipher,
+        ) as deployer:
+            return 0 if _run_action(deployer, args.check_only, args.update_only) else 1
+
+    try:
+        hosts = _read_hosts_file(args.hosts_file)
+    except OSError as exc:
+        parser.error(f"cannot read hosts file: {exc}")
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if not hosts:
+        parser.error(f"no hosts found in {args.hosts_file}")
+
+    multi_deployer = MultiSlaveDeployer(
+        hosts,
+        args.user,
+        args.deploy_path,
+        max_workers=args.parallelism,
+        compress=args.compress,
+        ssh_cipher=args.ssh_cipher,
+    )
+    results = multi_deployer.run(
+        lambda deployer: _run_action(deployer, args.check_only, args.update_only)
+    )
 
-    if args.update_only:
-        return 0 if deployer.update_library() else 1
+    print(f"\n{'Host':<40} Result")
+    print("-" * 48)
+    for host, success, _checks in results:
+        print(f"{host:<40} {'OK' if success else 'FAILED'}")
 
-    # Full deployment
-    return 0 if deployer.deploy_full() else 1
+    return 0 if all(success for _, success, _ in results) else 1
 
 
 if __name__ == "__main__":
@@ -1,9 +1,11 @@
 """Remote communication implementations for interacting with slave machines."""
 
 from kbisect.remote.base import RemoteClient
-from kbisect.remote.ssh import SSHClient
+from kbisect.remote.ssh import SSHClient, default_control_path
+
 
 __all__ = [
     "RemoteClient",
     "SSHClient",
+    "default_control_path",
 ]
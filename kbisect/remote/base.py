@@ -60,6 +60,14 @@ class RemoteClient(ABC):
         ret, _, _ = self.run_command("echo alive", timeout=15)
         return ret == 0
 
+    def close(self) -> None:
+        """Release any persistent connection to the remote host.
+
+        Default implementation does nothing. Implementations that keep a
+        connection open between commands should override this.
+        """
+        return None
+
     @abstractmethod
     def copy_file(self, local_path: str, remote_path: str) -> bool:
         """Copy file to remote host.
@@ -4,18 +4,74 @@
 Provides SSH-based remote client implementation for slave communication.
 """
 
+import hashlib
 import logging
+import os
 import select
 import shlex
 import subprocess
 import time
-from typing import Callable, Optional, Tuple
+from pathlib import Path
+from typing import BinaryIO, Callable, List, Optional, Tuple
 
 from kbisect.remote.base import RemoteClient
 
 
 logger = logging.getLogger(__name__)
 
+# Constants
+DEFAULT_CONTROL_PERSIST = "60s"
+
+
+def default_control_path(host: str, user: str) -> Optional[str]:
+    """Build a per-host, per-process control socket path for SSH multiplexing.
+
+    The socket lives in the current user's ~/.ssh directory, which must be
+    owned by that user and not accessible to anyone else, so other local
+    users cannot plant or hijack the socket. The name is derived from a
+    short hash of user@host and the current process ID, so concurrent
+    kbisect processes never share a master connection, and it stays well
+    below the UNIX socket path length limit.
+
+    Args:
+        host: Remote hostname or IP
+        user: SSH username
+
+    Returns:
+        Path to the control socket, or None if no private directory is
+        available (multiplexing is then disabled)
+    """
+    try:
+        home = Path.home()
+    except RuntimeError as exc:
+        logger.warning(f"SSH connection multiplexing disabled: {exc}")
+        return None
+
+    # Older Pythons return an unexpanded "~" when the home directory is unknown
+    if not home.is_absolute():
+        logger.warning("SSH connection multiplexing disabled: home directory not found")
+        return None
+
+    control_dir = home / ".ssh"
+
+    try:
+        control_dir.mkdir(mode=0o700, exist_ok=True)
+        dir_stat = control_dir.stat()
+    except OSError as exc:
+        logger.warning(f"SSH connection multiplexing disabled: {exc}")
+        return None
+
+    if dir_stat.st_uid != os.getuid() or dir_stat.st_mode & 0o077:
+        logger.warning(
+            f"SSH connection multiplexing disabled: {control_dir} is not private to current user"
+        )
+        return None
+
+    # Per-process socket: another kbisect process must not share (and close)
+    # this master connection
+    digest = hashlib.sha1(f"{user}@{host}:{os.getpid()}".encode()).hexdigest()[:12]
+    return str(control_dir / f"kbisect-cm-{digest}")
+
 
 class SSHClient(RemoteClient):
     """SSH client for slave communication.
@@ -25,39 +81,122 @@ class SSHClient(RemoteClient):
     Attributes:
         host: Slave hostname or IP
         user: SSH username
+        control_path: Control socket for connection multiplexing (None to disable)
+        control_persist: How long an idle master connection is kept open
+        cipher: Cipher used for new connections (None for ssh defaults)
+        compression: Enable or disable ssh compression (None for ssh defaults)
     """
 
-    def __init__(self, host: str, user: str = "root") -> None:
+    def __init__(
+        self,
+        host: str,
+        user: str = "root",
+        control_path: Optional[str] = None,
+        control_persist: str = DEFAULT_CONTROL_PERSIST,
+        cipher: Optional[str] = None,
+        compression: Optional[bool] = None,
+    ) -> None:
         """Initialize SSH client.
 
         Args:
             host: Slave hostname or IP
             user: SSH username
+            control_path: Control socket path; when set, commands share a single
+                authenticated connection via OpenSSH ControlMaster
+            control_persist: ControlPersist value for the master connection
+            cipher: Cipher passed to ssh -c (None for ssh defaults)
+            compression: ssh Compression setting (None for ssh defaults)
         """
         super().__init__(host, user)
+        self.control_path = control_path
+        self.control_persist = control_persist
+        self.cipher = cipher
+        self.compression = compression
+
+    def ssh_options(self) -> List[str]:
+        """Get common ssh command-line options.
+
+        Returns:
+            List of ssh option arguments
+        """
+        options = [
+            "-o",
+            "StrictHostKeyChecking=no",
+            "-o",
+            "ConnectTimeout=10",
+        ]
+
+        if self.cipher:
+            options.extend(["-c", self.cipher])
+
+        if self.compression is not None:
+            options.extend(["-o", f"Compression={'yes' if self.compression else 'no'}"])
+
+        if self.control_path:
+            options.extend(
+                [
+                    "-o",
+                    "ControlMaster=auto",
+                    "-o",
+                    f"ControlPath={self.control_path}",
+                    "-o",
+                    f"ControlPersist={self.control_persist}",
+                ]
+            )
+
+        return options
+
+    def close(self) -> None:
+        """Close the multiplexed master connection, if one is open."""
+        if not self.control_path or not Path(self.control_path).exists():
+            return
+
+        exit_command = [
+            "ssh",
+            "-o",
+            f"ControlPath={self.control_path}",
+            "-O",
+            "exit",
+            f"{self.user}@{self.host}",
+        ]
+
+        try:
+            subprocess.run(exit_command, capture_output=True, timeout=10, check=False)
+        except Exception as exc:
+            logger.debug(f"Failed to close SSH master connection: {exc}")
 
-    def run_command(self, command: str, timeout: Optional[int] = None) -> Tuple[int, str, str]:
+    def run_command(
+        self,
+        command: str,
+        timeout: Optional[int] = None,
+        input_file: Optional[BinaryIO] = None,
+    ) -> Tuple[int, str, str]:
         """Run command on slave via SSH.
 
         Args:
             command: Command to execute
             timeout: Command timeout in seconds
+            input_file: Optional open file fed to the remote command's stdin
 
         Returns:
             Tuple of (return_code, stdout, stderr)
         """
         ssh_command = [
             "ssh",
-            "-o",
-            "StrictHostKeyChecking=no",
-            "-o",
-            "ConnectTimeout=10",
+            *self.ssh_options(),
             f"{self.user}@{self.host}",
             command,
         ]
 
         try:
-            result = subprocess.run(ssh_command, capture_output=True, text=True, timeout=timeout, check=False)
+            result = subprocess.run(
+                ssh_command,
+                stdin=input_file,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                check=False,
+            )
             return result.returncode, result.stdout, result.stderr
         except subprocess.TimeoutExpired:
             logger.error(f"SSH command timed out after {timeout}s")
@@ -120,10 +259,7 @@ class SSHClient(RemoteClient):
 
         ssh_command = [
             "ssh",
-            "-o",
-            "StrictHostKeyChecking=no",
-            "-o",
-            "ConnectTimeout=10",
+            *self.ssh_options(),
             f"{self.user}@{self.host}",
             command,
         ]
@@ -199,8 +335,7 @@ class SSHClient(RemoteClient):
         """
         scp_command = [
             "scp",
-            "-o",
-            "StrictHostKeyChecking=no",
+            *self.ssh_options(),
             local_path,
             f"{self.user}@{self.host}:{remote_path}",
         ]